@@ -12,10 +12,15 @@ import tempfile
 import warnings
 import zipfile
 from datetime import datetime
-from functools import cached_property as _cached_property
 from functools import partial
 from functools import total_ordering
 from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Generic
+from typing import Optional
+from typing import TypeVar
+from typing import overload
 from urllib.parse import urlsplit
 from urllib.request import urlopen
 from warnings import warn
@@ -30,9 +35,52 @@ __all__ = [
 ]
 
 
+_T = TypeVar("_T")
+_NOT_FOUND = object()
+
+
 # noinspection PyPep8Naming
-class cached_property(_cached_property):
-    def __set__(self, obj, value):
+class cached_property(Generic[_T]):
+    """a readonly cached property
+
+    Unlike functools.cached_property (Python < 3.12) this does not
+    acquire a lock shared by all instances of the owner class when
+    computing the value.
+    """
+    def __init__(self, func: Callable[[Any], _T]) -> None:
+        self.func = func
+        self.attrname: Optional[str] = None
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        if self.attrname is None:
+            self.attrname = name
+        elif name != self.attrname:
+            raise TypeError(
+                "Cannot assign the same cached_property to two different names "
+                f"({self.attrname!r} and {name!r})."
+            )
+
+    @overload
+    def __get__(self, instance: None, owner: Optional[type] = None) -> "cached_property[_T]": ...
+
+    @overload
+    def __get__(self, instance: object, owner: Optional[type] = None) -> _T: ...
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        if self.attrname is None:
+            raise TypeError(
+                "Cannot use cached_property instance without calling __set_name__ on it."
+            )
+        cache = instance.__dict__
+        value = cache.get(self.attrname, _NOT_FOUND)
+        if value is _NOT_FOUND:
+            value = cache[self.attrname] = self.func(instance)
+        return value
+
+    def __set__(self, obj: object, value: Any) -> None:
         raise AttributeError(f"readonly attribute {self.attrname}")
 
 
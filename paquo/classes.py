@@ -4,7 +4,7 @@ from paquo.colors import ColorType
 from paquo.colors import QuPathColor
 from paquo.java import PathClass
 from paquo.java import PathClassFactory
-from paquo.java import String
+from paquo.java import String_cached
 from paquo.java import compatibility
 
 __all__ = ['QuPathPathClass']
@@ -67,7 +67,7 @@ class QuPathPathClass:
         elif isinstance(name, str):
             if ":" in name or "\n" in name:
                 raise ValueError("PathClass names cannot contain ':' or '\n'")
-            name = String(name)
+            name = String_cached(name)
         else:
             raise TypeError(f"name requires type 'str' got '{type(name)}'")
 
@@ -34,7 +34,6 @@ from paquo.java import ImageType
 from paquo.java import IOException
 from paquo.java import NoSuchFileException
 from paquo.java import PathIO
-from paquo.java import String
 from paquo.java import URISyntaxException
 from paquo.java import compatibility
 
@@ -140,7 +139,8 @@ class ImageProvider:
             # image_id is uri
             image_id = _normalize_pathlib_uris(image_id)
             return ImageProvider.URIString(image_id)
-        img_path = pathlib.Path(image_id).absolute().resolve()
+        # note: resolve() already returns an absolute path
+        img_path = pathlib.Path(image_id).resolve()
         if not img_path.is_file():
             return None
         return ImageProvider.URIString(img_path.as_uri())
@@ -275,6 +275,19 @@ class _ProjectImageEntryMetadata(MutableMapping):
     def __init__(self, image: 'QuPathProjectImageEntry') -> None:
         self._image = image
         self._entry = image.java_object
+        self._cache: Optional[Dict[str, str]] = None
+
+    def _load(self) -> Dict[str, str]:
+        """return the cached metadata, reading it from java on first use
+
+        note: mutations via this proxy write through to java and the cache
+        """
+        if self._cache is None:
+            # iterate the entry set once instead of looking up every key
+            self._cache = {
+                str(k): str(v) for k, v in self._entry.getMetadataMap().items()
+            }
+        return self._cache
 
     def __setitem__(self, k: str, v: str) -> None:
         # noinspection PyProtectedMember
@@ -284,7 +297,9 @@ class _ProjectImageEntryMetadata(MutableMapping):
             raise TypeError(f"key must be of type `str` got `{type(k)}`")
         if not isinstance(v, str):
             raise TypeError(f"value must be of type `str` got `{type(v)}`")
-        self._entry.putMetadataValue(String(str(k)), String(str(v)))
+        self._entry.putMetadataValue(k, v)
+        if self._cache is not None:
+            self._cache[k] = v
 
     def __delitem__(self, k: str) -> None:
         # noinspection PyProtectedMember
@@ -292,33 +307,38 @@ class _ProjectImageEntryMetadata(MutableMapping):
             raise AttributeError("project in readonly mode")
         if not isinstance(k, str):
             raise TypeError(f"key must be of type `str` got `{type(k)}`")
-        self._entry.removeMetadataValue(String(str(k)))
+        self._entry.removeMetadataValue(k)
+        if self._cache is not None:
+            self._cache.pop(k, None)
 
     def __getitem__(self, k: str) -> str:
         if not isinstance(k, str):
             raise TypeError(f"key must be of type `str` got `{type(k)}`")
-        v = self._entry.getMetadataValue(String(str(k)))
-        if v is None:
+        try:
+            return self._load()[k]
+        except KeyError:
             raise KeyError(f"'{k}' not in metadata")
-        return str(v)
 
     def __len__(self) -> int:
-        return int(self._entry.getMetadataKeys().size())
+        return len(self._load())
 
     def __iter__(self) -> Iterator[str]:
-        return iter(map(str, self._entry.getMetadataKeys()))
+        return iter(list(self._load()))
 
     def __contains__(self, item):
-        return bool(self._entry.containsMetadata(String(str(item))))
+        if not isinstance(item, str):
+            return False
+        return item in self._load()
 
     def clear(self) -> None:
         # noinspection PyProtectedMember
         if self._image._readonly:
             raise AttributeError("project in readonly mode")
         self._entry.clearMetadata()
+        self._cache = {}
 
     def __repr__(self):
-        return f"Metadata({repr(dict(self))})"
+        return f"Metadata({repr(self._load())})"
 
 
 class _ImageDataProperties(MutableMapping):
@@ -335,7 +355,7 @@ class _ImageDataProperties(MutableMapping):
             raise AttributeError("project in readonly mode")
         if not isinstance(k, str):
             raise TypeError(f"key must be of type `str` got `{type(k)}`")
-        self._image_data.setProperty(String(k), v)
+        self._image_data.setProperty(k, v)
 
     def __delitem__(self, k: str) -> None:
         # noinspection PyProtectedMember
@@ -343,28 +363,29 @@ class _ImageDataProperties(MutableMapping):
             raise AttributeError("project in readonly mode")
         if not isinstance(k, str):
             raise TypeError(f"key must be of type `str` got `{type(k)}`")
-        self._image_data.removeProperty(String(k))
+        self._image_data.removeProperty(k)
 
     def __getitem__(self, k: str) -> Any:
         if not isinstance(k, str):
             raise TypeError(f"key must be of type `str` got `{type(k)}`")
         if k not in self:
             raise KeyError(f"'{k}' not in metadata")
-        v = self._image_data.getProperty(String(k))
+        v = self._image_data.getProperty(k)
         return v
 
     def __contains__(self, item: Any) -> bool:
         if not isinstance(item, str):
             return False
         return bool(
-            self._image_data.getProperties().containsKey(String(item))
+            self._image_data.getProperties().containsKey(item)
         )
 
     def __len__(self) -> int:
         return int(self._image_data.getProperties().size())
 
     def __iter__(self) -> Iterator[str]:
-        return iter(map(str, dict(self._image_data.getProperties())))
+        # only materialize the keys, in a single call
+        return iter([str(k) for k in self._image_data.getProperties().keySet().toArray()])
 
     def __repr__(self):
         return f"Properties({repr(dict(self))})"
@@ -416,10 +437,21 @@ class QuPathProjectImageEntry:
         """
         if not isinstance(entry, DefaultProjectImageEntry):
             raise ValueError("don't instantiate directly. use `QuPathProject.add_image`")
+        self._init(entry, _project_ref)
+
+    def _init(self, entry, project) -> None:
         self.java_object = entry
-        self._project_ref = weakref.ref(_project_ref) if _project_ref else lambda: None
+        self._project_ref = weakref.ref(project) if project else lambda: None
         self._metadata = _ProjectImageEntryMetadata(self)
 
+    @classmethod
+    def _wrap(cls, entry: DefaultProjectImageEntry,
+              project: 'paquo.projects.QuPathProject') -> 'QuPathProjectImageEntry':
+        """internal: wrap an entry obtained from the project without type checks"""
+        self = cls.__new__(cls)
+        self._init(entry, project)
+        return self
+
     @property
     def _readonly(self):
         p = self._project_ref()
@@ -459,12 +491,12 @@ class QuPathProjectImageEntry:
                 raise
         return server
 
-    @property
+    @cached_property
     def entry_id(self) -> str:
         """the unique image entry id"""
         return str(self.java_object.getID())
 
-    @property
+    @cached_property
     def entry_path(self) -> Path:
         """path to the image directory"""
         return Path(str(self.java_object.getEntryPath().toString()))
@@ -478,7 +510,7 @@ class QuPathProjectImageEntry:
     def image_name(self, name: str) -> None:
         if self._readonly:
             raise AttributeError("project in readonly mode")
-        self.java_object.setImageName(String(name))
+        self.java_object.setImageName(name)
 
     # remove until there's a good use case for this...
     # @property
@@ -683,6 +715,39 @@ class QuPathProjectImageEntry:
             raise NotImplementedError("unsupported in paquo as of now")
         return str(uris[0].toString())
 
+    def thumbnail_array(self) -> Any:
+        """return the image thumbnail as an RGB uint8 array of shape (height, width, 3)
+
+        Notes
+        -----
+        The thumbnail stays on the java side until requested. The pixels
+        are then transferred from java in a single bulk copy.
+        Requires numpy to be installed.
+        """
+        try:
+            import numpy as np
+        except ImportError:  # pragma: no cover
+            raise RuntimeError(f"{type(self).__name__}.thumbnail_array requires 'numpy'")
+
+        with redirect(stdout=True, stderr=True):
+            try:
+                thumbnail = self.java_object.getThumbnail()
+            # from java land
+            except IOException as err:  # pragma: no cover
+                raise OSError(f"could not read thumbnail: {err}")
+        if thumbnail is None:
+            raise FileNotFoundError("image entry has no thumbnail")
+
+        width = int(thumbnail.getWidth())
+        height = int(thumbnail.getHeight())
+        # getRGB returns packed ARGB ints independent of the image type
+        argb = thumbnail.getRGB(0, 0, width, height, None, 0, width)
+        packed = np.asarray(argb, dtype=np.int32).view(np.uint32).reshape(height, width)
+        return np.stack(
+            [(packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF],
+            axis=-1,
+        ).astype(np.uint8)
+
     def is_readable(self) -> bool:
         """check if the image file is readable"""
         concrete_path = Path(ImageProvider.path_from_uri(self.uri))
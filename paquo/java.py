@@ -1,4 +1,5 @@
 import warnings
+from functools import lru_cache
 
 from paquo._config import settings
 from paquo._config import to_kwargs
@@ -98,6 +99,7 @@ PrintStream = JClass('java.io.PrintStream')
 StandardCharsets = JClass("java.nio.charset.StandardCharsets")
 String = JClass('java.lang.String')
 System = JClass('java.lang.System')
+Thread = JClass('java.lang.Thread')
 URI = JClass('java.net.URI')
 
 ColorTools = JClass('qupath.lib.common.ColorTools')
@@ -159,6 +161,14 @@ FileNotFoundException = JClass('java.io.FileNotFoundException')
 NoSuchFileException = JClass('java.nio.file.NoSuchFileException')
 
 
+# noinspection PyPep8Naming
+@lru_cache(maxsize=1024)
+def String_cached(value: str):
+    """return a shared java String for short, frequently repeated values"""
+    # java Strings are immutable, so instances can safely be reused
+    return String(value)
+
+
 def __getattr__(name):
     """lazy import some"""
     if name == "ProjectImportImagesCommand":
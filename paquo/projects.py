@@ -1,13 +1,20 @@
 import collections.abc as collections_abc
 import math
+import os
 import pathlib
 import re
 import shutil
+import threading
+from collections import deque
+from collections import OrderedDict
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from contextlib import nullcontext
 from typing import Any
 from typing import Callable
 from typing import ContextManager
+from typing import Deque
 from typing import Dict
 from typing import Iterable
 from typing import Iterator
@@ -22,12 +29,14 @@ from typing import overload
 from paquo import settings
 from paquo._logging import get_logger
 from paquo._logging import redirect
+from paquo._utils import cached_property
 from paquo._utils import make_backup_filename
 from paquo.classes import QuPathPathClass
 from paquo.images import ImageProvider
 from paquo.images import QuPathImageType
 from paquo.images import QuPathProjectImageEntry
 from paquo.images import SimpleFileImageId
+from paquo.images import _normalize_pathlib_uris
 from paquo.java import URI
 from paquo.java import BufferedImage
 from paquo.java import DefaultProject
@@ -43,6 +52,7 @@ from paquo.java import ProjectIO
 from paquo.java import Projects
 from paquo.java import ServerTools
 from paquo.java import String
+from paquo.java import Thread
 from paquo.java import compatibility
 
 _log = get_logger(__name__)
@@ -57,10 +67,18 @@ class _ProjectImageEntriesProxy(collections_abc.Sequence):
         if not isinstance(project.java_object, DefaultProject):
             raise TypeError('requires DefaultProject instance')  # pragma: no cover
         self._project = project
+        # the project path is fixed for the lifetime of the java project
+        self._project_path = str(project.java_object.getPath().toAbsolutePath().toString())
         self._images = {
-            self._key_func(entry): QuPathProjectImageEntry(entry, _project_ref=self._project)
-            for entry in self._project.java_object.getImageList()
+            self._key_func(entry): QuPathProjectImageEntry._wrap(entry, self._project)
+            for entry in self._java_entries()
         }
+        self._entries: Optional[List[QuPathProjectImageEntry]] = None
+
+    def _java_entries(self):
+        """materialize the java image list in a single call"""
+        # iterating the java list directly calls hasNext/next via JNI per entry
+        return self._project.java_object.getImageList().toArray()
 
     def _key_func(self, entry):
         """retrieve the fullProjectID from an ImageEntry
@@ -69,25 +87,60 @@ class _ProjectImageEntriesProxy(collections_abc.Sequence):
         """
         # basically `DefaultProjectImageEntry.getFullProjectEntryID()`
         # but don't go via image_data
-        return (
-            str(self._project.java_object.getPath().toAbsolutePath().toString()),
-            str(entry.getID()),
-        )
+        return self._project_path, str(entry.getID())
 
     def refresh(self):
         removed = set(self._images.keys())
-        for entry in self._project.java_object.getImageList():
+        for entry in self._java_entries():
             key = self._key_func(entry)
             if key not in self._images:
-                self._images[key] = QuPathProjectImageEntry(entry, _project_ref=self._project)
+                self._images[key] = QuPathProjectImageEntry._wrap(entry, self._project)
             else:
                 removed.discard(key)  # existing entry
         if removed:
             for key in removed:  # pragma: no cover
                 _ = self._images.pop(key)
+        self._entries = None
+
+    def register(self, entry) -> QuPathProjectImageEntry:
+        """track a single java image entry without a full refresh"""
+        key = self._key_func(entry)
+        py_entry = self._images.get(key)
+        if py_entry is None:
+            py_entry = QuPathProjectImageEntry._wrap(entry, self._project)
+            self._images[key] = py_entry
+            self._entries = None
+        return py_entry
+
+    def unregister(self, entry) -> None:
+        """stop tracking a single java image entry without a full refresh"""
+        if self._images.pop(self._key_func(entry), None) is not None:
+            self._entries = None
+
+    def _snapshot(self) -> List[QuPathProjectImageEntry]:
+        """cached list of the current image entries"""
+        if self._entries is None:
+            self._entries = list(self._images.values())
+        return self._entries
 
     def __iter__(self) -> Iterator[QuPathProjectImageEntry]:
-        return iter(self._images.values())
+        return iter(self._snapshot())
+
+    def __reversed__(self) -> Iterator[QuPathProjectImageEntry]:
+        return reversed(self._snapshot())
+
+    # note: the Sequence mixin implementations index via __getitem__ one
+    #   item at a time. Delegate to the cached list instead.
+    def index(self, value: Any, start: Optional[int] = 0, stop: Optional[int] = None) -> int:
+        entries = self._snapshot()
+        if start is None:
+            start = 0
+        if stop is None:
+            stop = len(entries)
+        return entries.index(value, start, stop)
+
+    def count(self, value: Any) -> int:
+        return self._snapshot().count(value)
 
     def __contains__(self, entry: object) -> bool:
         if not isinstance(entry, QuPathProjectImageEntry):
@@ -123,7 +176,7 @@ class _ProjectImageEntriesProxy(collections_abc.Sequence):
     def __getitem__(self, i):
         if not isinstance(i, (int, slice)):
             raise IndexError(i)
-        return list(self._images.values())[i]
+        return self._snapshot()[i]
 
 
 def _stash_project_files(project_dir: pathlib.Path):
@@ -161,6 +214,9 @@ def _stash_project_files(project_dir: pathlib.Path):
 
 DEFAULT_IMAGE_PROVIDER: Any = ImageProvider()
 
+# number of image server support probes remembered per project
+IMAGE_SUPPORT_CACHE_SIZE = 64
+
 
 ProjectIOMode = Literal["r", "r+", "w", "w+", "a", "a+", "x", "x+"]
 
@@ -248,6 +304,10 @@ class QuPathProject:
         self.java_object = project
         self._image_entries_proxy = _ProjectImageEntriesProxy(self)
         self._image_provider = image_provider
+        # cache of image server support probes keyed by image uri
+        self._image_support_cache: 'OrderedDict[str, Any]' = OrderedDict()
+        self._image_support_lock = threading.Lock()
+        self._path_classes: Optional[Tuple[QuPathPathClass, ...]] = None
 
     @property
     def images(self) -> Sequence[QuPathProjectImageEntry]:
@@ -263,10 +323,9 @@ class QuPathProject:
         except Exception:
             # todo: check if we could set removeAllData to True here
             self.java_object.removeImage(entry, False)
-            raise
-        finally:
-            # update the proxy
+            # resync the proxy in case qupath did something unexpected
             self._image_entries_proxy.refresh()
+            raise
 
     @overload
     def add_image(
@@ -276,6 +335,7 @@ class QuPathProject:
         *,
         allow_duplicates: bool = ...,
         return_list: Literal[True],
+        thumbnail: bool = ...,
     ) -> List[QuPathProjectImageEntry]:
         ...
 
@@ -287,6 +347,7 @@ class QuPathProject:
         *,
         allow_duplicates: bool = ...,
         return_list: Literal[False] = ...,
+        thumbnail: bool = ...,
     ) -> Union[QuPathProjectImageEntry, List[QuPathProjectImageEntry]]:
         ...
 
@@ -298,6 +359,7 @@ class QuPathProject:
         *,
         allow_duplicates: bool = False,
         return_list: bool = False,
+        thumbnail: bool = True,
     ) -> Union[QuPathProjectImageEntry, List[QuPathProjectImageEntry]]:
         """add an image to the project
 
@@ -310,12 +372,143 @@ class QuPathProject:
             be prompted before opening the image in QuPath.
         allow_duplicates:
             check if file has already been added to the project.
+        return_list:
+            always return a list of image entries.
+        thumbnail:
+            generate the image thumbnail. Skipping it avoids reading pixel
+            data when adding many images. QuPath will show a placeholder.
 
         """
         # readonly?
         if self._readonly:
             raise OSError("project in readonly mode")
         # test if we may add:
+        known_uris: Optional[List[Optional[str]]]
+        if allow_duplicates:
+            known_uris = None
+        else:
+            known_uris = [self._image_provider.uri(entry.uri) for entry in self.images]
+        img_uri = self._resolve_image_uri(image_id, known_uris)
+
+        entries = []
+        for server_builder in self._get_server_builders(image_id, img_uri):
+            image_name, thumbnail_image = self._read_image_server(
+                server_builder, image_id, img_uri, thumbnail=thumbnail
+            )
+            py_entry = self._add_image_entry(
+                server_builder, image_name, thumbnail_image, image_type
+            )
+            entries.append(py_entry)
+        if return_list or len(entries) > 1:
+            return entries
+        else:
+            return entries[0]
+
+    @redirect(stderr=True, stdout=True)
+    def add_images(
+        self,
+        image_ids: Iterable[SimpleFileImageId],
+        image_type: Optional[QuPathImageType] = None,
+        *,
+        allow_duplicates: bool = False,
+        thumbnail: bool = True,
+        max_workers: Optional[int] = None,
+    ) -> List[QuPathProjectImageEntry]:
+        """add multiple images to the project
+
+        Opening the images and generating their thumbnails is done
+        concurrently in a thread pool. The entries are added to the
+        project in the order of the provided image_ids.
+
+        If reading an image fails, the entries for all image_ids before
+        it have already been added to and saved in the project, and the
+        exception is re-raised. Check `QuPathProject.images` to see which
+        images were added.
+
+        Parameters
+        ----------
+        image_ids:
+            image_ids pointing to the image files (with default image_provider: filenames)
+        image_type:
+            provide an image type for the images. If not provided the user will
+            be prompted before opening the images in QuPath.
+        allow_duplicates:
+            check if files have already been added to the project.
+        thumbnail:
+            generate the image thumbnails.
+        max_workers:
+            number of threads used for reading images. Uses the
+            concurrent.futures.ThreadPoolExecutor default if None.
+
+        """
+        if self._readonly:
+            raise OSError("project in readonly mode")
+        image_ids = list(image_ids)
+        # test if we may add all images before doing any work
+        known_uris: Optional[List[Optional[str]]]
+        if allow_duplicates:
+            known_uris = None
+        else:
+            known_uris = [self._image_provider.uri(entry.uri) for entry in self.images]
+        img_uris = []
+        for image_id in image_ids:
+            img_uri = self._resolve_image_uri(image_id, known_uris)
+            if known_uris is not None:
+                known_uris.append(img_uri)
+            img_uris.append(img_uri)
+
+        def prepare(image_id, img_uri):
+            return [
+                (server_builder, *self._read_image_server(
+                    server_builder, image_id, img_uri, thumbnail=thumbnail
+                ))
+                for server_builder in self._get_server_builders(image_id, img_uri)
+            ]
+
+        def add_prepared(future):
+            for server_builder, image_name, thumbnail_image in future.result():
+                py_entry = self._add_image_entry(
+                    server_builder, image_name, thumbnail_image, image_type,
+                    save_project=False,
+                )
+                entries.append(py_entry)
+
+        if max_workers is None:
+            # same default as concurrent.futures.ThreadPoolExecutor
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+        # bound the number of prepared images (incl. thumbnails) held in memory
+        window = 2 * max_workers
+
+        entries: List[QuPathProjectImageEntry] = []
+        pending: Deque[Future] = deque()
+        with ThreadPoolExecutor(
+            max_workers=max_workers,
+            initializer=Thread.attachAsDaemon,
+        ) as executor:
+            try:
+                # modify the project only from this thread to keep the entry order
+                for image_id, img_uri in zip(image_ids, img_uris):
+                    pending.append(executor.submit(prepare, image_id, img_uri))
+                    if len(pending) >= window:
+                        add_prepared(pending.popleft())
+                while pending:
+                    add_prepared(pending.popleft())
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+            finally:
+                # sync the project once for all added entries
+                if entries:
+                    self.save(images=False)
+        return entries
+
+    def _resolve_image_uri(
+        self,
+        image_id: SimpleFileImageId,
+        known_uris: Optional[Sequence[Optional[str]]],
+    ) -> str:
+        """internal: get the uri for an image_id and check for duplicates"""
         img_uri = self._image_provider.uri(image_id)
         if img_uri is None:
             raise FileNotFoundError(f"image_provider can't provide URI for requested image_id: '{image_id}'")
@@ -323,72 +516,131 @@ class QuPathProject:
         # if img_id != image_id:  # pragma: no cover
         #     _log.warning(f"image_provider roundtrip error: '{image_id}' -> uri -> '{img_id}'")
 
-        if not allow_duplicates:
-            for entry in self.images:
-                if img_uri == self._image_provider.uri(entry.uri):
+        if known_uris is not None:
+            for uri in known_uris:
+                if img_uri == uri:
                     raise FileExistsError(image_id)
-
-        # first get a server builder
-        try:
-            support = ImageServerProvider.getPreferredUriImageSupport(
-                BufferedImage,
-                String(img_uri),
-            )
-        except IOException:  # pragma: no cover
-            # it's possible that an image_provider returns an URI but that URI
-            # is not actually reachable. In that case catch the java IOException
-            # and raise a FileNotFoundError here
-            raise FileNotFoundError(f"{image_id!r} as {img_uri!r}")
-        except ExceptionInInitializerError:
-            raise OSError("no preferred support found")
-        if not support:
-            raise OSError("no preferred support found")  # pragma: no cover
+        return img_uri
+
+    def _get_server_builders(self, image_id: SimpleFileImageId, img_uri: str) -> List[Any]:
+        """internal: get the server builders for an image uri"""
+        key = self._image_support_key(img_uri)
+        with self._image_support_lock:
+            support = self._image_support_cache.get(key)
+            if support is not None:
+                self._image_support_cache.move_to_end(key)
+        if support is None:
+            try:
+                support = ImageServerProvider.getPreferredUriImageSupport(
+                    BufferedImage,
+                    String(img_uri),
+                )
+            except IOException:  # pragma: no cover
+                # it's possible that an image_provider returns an URI but that URI
+                # is not actually reachable. In that case catch the java IOException
+                # and raise a FileNotFoundError here
+                raise FileNotFoundError(f"{image_id!r} as {img_uri!r}")
+            except ExceptionInInitializerError:
+                raise OSError("no preferred support found")
+            if not support:
+                raise OSError("no preferred support found")  # pragma: no cover
+            # probing all image server providers is expensive, so remember it
+            with self._image_support_lock:
+                self._image_support_cache[key] = support
+                while len(self._image_support_cache) > IMAGE_SUPPORT_CACHE_SIZE:
+                    self._image_support_cache.popitem(last=False)
         server_builders = list(support.getBuilders())
         if not server_builders:
             raise OSError("no supported server builders found")  # pragma: no cover
+        return server_builders
 
-        entries = []
-        for server_builder in server_builders:
-            with self._stage_image_entry(server_builder) as j_entry:
-                # all of this happens in qupath.lib.gui.commands.ProjectImportImagesCommand
-                try:
-                    server = server_builder.build()
-                except IOException:
-                    _, _, _sb = server_builder.__class__.__name__.rpartition(".")
-                    raise OSError(f"{_sb} can't open {str(image_id)}")
-                j_entry.setImageName(ServerTools.getDisplayableImageName(server))
-
-                # add some informative logging
-                _md = server.getMetadata()
-                width = int(_md.getWidth())
-                height = int(_md.getHeight())
-                downsamples = [float(x) for x in _md.getPreferredDownsamplesArray()]
-                target_downsample = math.sqrt(width / 1024.0 * height / 1024.0)
-                _log.info(f"Image[{width}x{height}] with downsamples {downsamples}")
-                if not any(d >= target_downsample for d in downsamples):
-                    _log.warning("No matching downsample for thumbnail! This might take a long time...")
-
-                # set the project thumbnail
-                try:
-                    thumbnail = ProjectImportImagesCommand_getThumbnailRGB(server, None)
-                except NegativeArraySizeException:  # pragma: no cover
-                    raise RuntimeError(
-                        "Thumbnailing FAILED. Image might be too large and has no embedded thumbnail."
-                    )
-                else:
-                    j_entry.setThumbnail(thumbnail)
-
-            py_entry = self._image_entries_proxy[-1]
-            if image_type is not None:
-                py_entry.image_type = image_type
-            # save project after adding image
-            py_entry.save()
+    @staticmethod
+    def _image_support_key(uri: str) -> str:
+        """internal: normalize an image uri for the image support cache"""
+        # image_provider uris and java entry uris differ in their string form
+        try:
+            return str(_normalize_pathlib_uris(str(uri)).toString())
+        except ValueError:  # pragma: no cover
+            return str(uri)
+
+    def _discard_image_support(self, uri: str) -> None:
+        """internal: drop cached image server support for an image uri"""
+        key = self._image_support_key(uri)
+        with self._image_support_lock:
+            self._image_support_cache.pop(key, None)
+
+    def _read_image_server(
+        self,
+        server_builder: Any,
+        image_id: SimpleFileImageId,
+        img_uri: str,
+        *,
+        thumbnail: bool,
+    ) -> Tuple[Any, Any]:
+        """internal: read the image name and thumbnail via a server builder
+
+        note: this does not modify the java project and may run in a worker
+          thread. It only touches the image support cache, which is guarded
+          by a lock.
+        """
+        # all of this happens in qupath.lib.gui.commands.ProjectImportImagesCommand
+        try:
+            server = server_builder.build()
+        except IOException:
+            # the file might have changed since its support was probed
+            self._discard_image_support(str(img_uri))
+            _, _, _sb = server_builder.__class__.__name__.rpartition(".")
+            raise OSError(f"{_sb} can't open {str(image_id)}")
+        try:
+            image_name = ServerTools.getDisplayableImageName(server)
+            if not thumbnail:
+                return image_name, None
+
+            # add some informative logging
+            _md = server.getMetadata()
+            width = int(_md.getWidth())
+            height = int(_md.getHeight())
+            downsamples = [float(x) for x in _md.getPreferredDownsamplesArray()]
+            target_downsample = math.sqrt(width / 1024.0 * height / 1024.0)
+            _log.info(f"Image[{width}x{height}] with downsamples {downsamples}")
+            if not any(d >= target_downsample for d in downsamples):
+                _log.warning("No matching downsample for thumbnail! This might take a long time...")
+
+            # get the project thumbnail
+            try:
+                thumbnail_image = ProjectImportImagesCommand_getThumbnailRGB(server, None)
+            except NegativeArraySizeException:  # pragma: no cover
+                raise RuntimeError(
+                    "Thumbnailing FAILED. Image might be too large and has no embedded thumbnail."
+                )
+            return image_name, thumbnail_image
+        finally:
+            # the entry builds its own server when reading image data
+            server.close()
+
+    def _add_image_entry(
+        self,
+        server_builder: Any,
+        image_name: Any,
+        thumbnail_image: Any,
+        image_type: Optional[QuPathImageType],
+        *,
+        save_project: bool = True,
+    ) -> QuPathProjectImageEntry:
+        """internal: add a new image entry to the project and save it"""
+        with self._stage_image_entry(server_builder) as j_entry:
+            j_entry.setImageName(image_name)
+            if thumbnail_image is not None:
+                j_entry.setThumbnail(thumbnail_image)
+
+        py_entry = self._image_entries_proxy.register(j_entry)
+        if image_type is not None:
+            py_entry.image_type = image_type
+        # save project after adding image
+        py_entry.save()
+        if save_project:
             self.save(images=False)
-            entries.append(py_entry)
-        if return_list or len(entries) > 1:
-            return entries
-        else:
-            return entries[0]
+        return py_entry
 
     def is_readable(self) -> Dict[str, bool]:
         """verify if images are reachable"""
@@ -477,13 +729,28 @@ class QuPathProject:
             )
         if self._readonly:
             raise OSError("project in readonly mode")
+        # re-adding the image should probe the file again
+        try:
+            self._discard_image_support(image_entry.uri)
+        except (RuntimeError, NotImplementedError):  # pragma: no cover
+            pass  # entry without a single server uri
         try:
             self.java_object.removeImage(image_entry.java_object, False)
-        finally:
+        except Exception:  # pragma: no cover
             self._image_entries_proxy.refresh()
+            raise
+        else:
+            # noinspection PyProtectedMember
+            if image_entry._project_ref() is self:
+                self._image_entries_proxy.unregister(image_entry.java_object)
+            else:
+                # qupath ignores entries of other projects, but the proxy key
+                # only contains the entry id, so resync instead of unregistering
+                self._image_entries_proxy.refresh()
+        finally:
             self.save(images=False)
 
-    @property
+    @cached_property
     def uri(self) -> str:
         """the uri identifying the project location"""
         return str(self.java_object.getURI().toString())
@@ -499,7 +766,11 @@ class QuPathProject:
     @property
     def path_classes(self) -> Tuple[QuPathPathClass, ...]:
         """return path_classes stored in the project"""
-        return tuple(map(QuPathPathClass.from_java, self.java_object.getPathClasses()))
+        if self._path_classes is None:
+            self._path_classes = tuple(
+                map(QuPathPathClass.from_java, self.java_object.getPathClasses())
+            )
+        return self._path_classes
 
     @path_classes.setter
     def path_classes(self, path_classes: Iterable[QuPathPathClass]):
@@ -507,9 +778,10 @@ class QuPathProject:
         if self._readonly:
             raise AttributeError("project in readonly mode")
         pcs = [pc.java_object for pc in path_classes]
+        self._path_classes = None
         self.java_object.setPathClasses(pcs)
 
-    @property
+    @cached_property
     def path(self) -> pathlib.Path:
         """the path to the project root"""
         return pathlib.Path(str(self.java_object.getPath()))
@@ -563,7 +835,7 @@ class QuPathProject:
             repr_html(self.images),
         )
 
-    @property
+    @cached_property
     def timestamp_creation(self) -> int:
         """system time at creation in milliseconds"""
         return int(self.java_object.getCreationTimestamp())
@@ -72,6 +72,18 @@ def test_image_entry_return_hierarchy(image_entry):
     assert isinstance(image_entry.hierarchy, QuPathPathObjectHierarchy)
 
 
+def test_image_data_is_loaded_lazily(svs_small, tmp_path):
+    with QuPathProject(tmp_path / "paquo-project", mode='x') as qp:
+        qp.add_image(svs_small)
+
+    with QuPathProject(tmp_path / "paquo-project", mode='r') as qp:
+        entry = qp.images[0]
+        assert entry.image_name == "CMU-1-Small-Region.svs"
+        assert "_image_data" not in vars(entry)
+        assert entry.image_type == QuPathImageType.UNSET
+        assert "_image_data" in vars(entry)
+
+
 def test_identifiers(image_entry):
     assert image_entry.entry_id == "1"  # first image...
     assert image_entry.image_name == "CMU-1-Small-Region.svs"
@@ -143,6 +155,24 @@ def test_metadata_interface(image_entry):
     assert len(image_entry.metadata) == 0
 
 
+def test_metadata_cache_writes_through(image_entry):
+    image_entry.metadata = {"a": "1"}
+    # warm the cache
+    assert dict(image_entry.metadata) == {"a": "1"}
+
+    image_entry.metadata["b"] = "2"
+    assert dict(image_entry.metadata) == {"a": "1", "b": "2"}
+    assert str(image_entry.java_object.getMetadataValue("b")) == "2"
+
+    del image_entry.metadata["a"]
+    assert dict(image_entry.metadata) == {"b": "2"}
+    assert image_entry.java_object.getMetadataValue("a") is None
+
+    image_entry.metadata.clear()
+    assert dict(image_entry.metadata) == {}
+    assert image_entry.java_object.getMetadataValue("b") is None
+
+
 # noinspection PyTypeChecker
 def test_metadata_non_str_items(image_entry):
 
@@ -152,6 +182,9 @@ def test_metadata_non_str_items(image_entry):
     with pytest.raises(TypeError):
         image_entry.metadata["1"] = 123
 
+    assert 1 not in image_entry.metadata
+    assert [1] not in image_entry.metadata
+
 
 def test_imagedata_saving_for_removed_images(project_with_removed_image):
     with QuPathProject(project_with_removed_image, mode='r+') as qp:
@@ -220,6 +253,21 @@ def test_properties_interface(image_entry):
     assert dict(image_entry.properties) == {}
 
 
+def test_thumbnail_array(image_entry):
+    thumbnail = image_entry.thumbnail_array()
+    assert thumbnail.ndim == 3
+    assert thumbnail.shape[2] == 3
+    assert thumbnail.dtype.name == "uint8"
+    assert thumbnail.any()
+
+
+def test_thumbnail_array_missing(svs_small, tmp_path):
+    qp = QuPathProject(tmp_path / "paquo-project", mode='x')
+    entry = qp.add_image(svs_small, thumbnail=False)
+    with pytest.raises(FileNotFoundError):
+        entry.thumbnail_array()
+
+
 def test_description(image_entry):
     assert image_entry.description == ""
     image_entry.description = "abc"
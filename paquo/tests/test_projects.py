@@ -231,6 +231,34 @@ def test_project_add_image_with_type(new_project, svs_small):
     assert entry.image_type == t
 
 
+def test_project_add_images(new_project, svs_small, tmp_path):
+    other = tmp_path / "other.svs"
+    shutil.copy(svs_small, other)
+    t = QuPathImageType.BRIGHTFIELD_H_E
+    entries = new_project.add_images([svs_small, other], image_type=t, max_workers=2)
+    assert [e.entry_id for e in entries] == ["1", "2"]
+    assert list(new_project.images) == entries
+    assert all(e.image_type == t for e in entries)
+
+    with pytest.raises(FileExistsError):
+        new_project.add_images([svs_small])
+    assert len(new_project.images) == 2
+
+
+def test_project_add_images_duplicates_in_batch(new_project, svs_small):
+    with pytest.raises(FileExistsError):
+        new_project.add_images([svs_small, svs_small])
+    assert len(new_project.images) == 0
+    entries = new_project.add_images([svs_small, svs_small], allow_duplicates=True)
+    assert len(entries) == 2
+
+
+def test_project_add_image_without_thumbnail(new_project, svs_small):
+    entry = new_project.add_image(svs_small, thumbnail=False)
+    assert not (entry.entry_path / "thumbnail.jpg").is_file()
+    assert entry._repr_html_()
+
+
 def test_project_add_unsupported_image(new_project, tmp_path):
     image = Path(tmp_path) / "unsupported.image"
     with open(image, "w") as f:
@@ -248,6 +276,54 @@ def test_project_remove_image(new_project, svs_small):
     assert len(new_project.images) == 0
 
 
+def test_project_remove_image_discards_image_support(new_project, svs_small):
+    entry = new_project.add_image(svs_small)
+    assert len(new_project._image_support_cache) == 1
+    new_project.remove_image(entry)
+    assert len(new_project._image_support_cache) == 0
+
+
+def test_project_image_support_cache_is_bounded(new_project, svs_small, tmp_path, monkeypatch):
+    monkeypatch.setattr("paquo.projects.IMAGE_SUPPORT_CACHE_SIZE", 1)
+    other = tmp_path / "other.svs"
+    shutil.copy(svs_small, other)
+    new_project.add_images([svs_small, other])
+    assert len(new_project._image_support_cache) == 1
+
+
+def test_project_remove_image_from_other_project(new_project, svs_small, tmp_path):
+    entry = new_project.add_image(svs_small)
+    other_project = QuPathProject(tmp_path / "other-project", mode='x')
+    other_entry = other_project.add_image(svs_small)
+    assert entry.entry_id == other_entry.entry_id
+
+    new_project.remove_image(other_entry)
+    assert len(new_project.images) == 1
+    assert list(new_project.images) == [entry]
+    assert len(other_project.images) == 1
+
+
+def test_project_remove_images_while_iterating(new_project, svs_small):
+    new_project.add_image(svs_small)
+    new_project.add_image(svs_small, allow_duplicates=True)
+    assert [a.entry_id for a in new_project.images for _ in new_project.images] == ["1", "1", "2", "2"]
+    for entry in new_project.images:
+        new_project.remove_image(entry)
+    assert len(new_project.images) == 0
+
+
+def test_project_images_sequence_methods(new_project, svs_small):
+    a, b = new_project.add_images([svs_small, svs_small], allow_duplicates=True)
+    assert list(reversed(new_project.images)) == [b, a]
+    assert new_project.images.index(b) == 1
+    assert new_project.images.index(b, 0, None) == 1
+    assert new_project.images.index(a, None, None) == 0
+    assert new_project.images.count(a) == 1
+    assert new_project.images.count(object()) == 0
+    with pytest.raises(ValueError):
+        new_project.images.index(object())
+
+
 def test_project_remove_image_wrong_type(new_project):
     with pytest.raises(TypeError):
         new_project.remove_image("some/file.svs")
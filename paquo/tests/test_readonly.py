@@ -60,7 +60,9 @@ def iter_readonly_properties(obj):
 
 @contextmanager
 def assert_no_modification(qp):
-    ctime, mtime = qp.timestamp_creation, qp.timestamp_modification
+    # note: timestamp_creation is cached, so read it from java directly
+    ctime = int(qp.java_object.getCreationTimestamp())
+    mtime = qp.timestamp_modification
     yield qp
     project_path = qp.path.parent
     files = project_path.glob("**/*.*")
@@ -68,7 +70,7 @@ def assert_no_modification(qp):
     for file in files:
         p = str(file.absolute())
         assert qp.__changes.get(p, None) == file.stat().st_mtime, f"{str(file.relative_to(project_path))} was modified"
-    assert qp.timestamp_creation == ctime
+    assert int(qp.java_object.getCreationTimestamp()) == ctime
     assert qp.timestamp_modification == mtime
 
 
@@ -122,6 +124,8 @@ def test_project_attrs_and_methods(readonly_project, copy_svs_small):
         # These should raise an IOError when readonly
         with pytest.raises(IOError):
             a.callmethod("add_image", copy_svs_small, allow_duplicates=True)
+        with pytest.raises(IOError):
+            a.callmethod("add_images", [copy_svs_small], allow_duplicates=True)
         with pytest.raises(IOError):
             a.callmethod("save")
         with pytest.raises(IOError):
@@ -163,6 +167,7 @@ def test_images_attrs_methods_readonly(readonly_project):
         # these do nothing
         i.callmethod("is_changed")
         i.callmethod("is_readable")
+        i.callmethod("thumbnail_array")
 
         # these need to be blocked
         with pytest.raises(AttributeError):